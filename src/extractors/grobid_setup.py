@@ -1,6 +1,16 @@
+import json
 import os
-from grobid_client.grobid_client import GrobidClient
+import queue
+import threading
+import time
+import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from lxml import etree
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from typing import Dict, Iterator, List
+
+from .reference_parser import parse_grobid_xml
 
 BASE_DIR = Path(__file__).resolve().parents[2] # PaperNavigator/
 
@@ -11,15 +21,123 @@ OUTPUT_DIR = BASE_DIR / "data" / "outputs"
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-client = GrobidClient(config_path=str(CONFIG_PATH))
+with open(CONFIG_PATH, encoding='utf-8') as f:
+    config = json.load(f)
+
+GROBID_URL = f"{config['grobid_server'].rstrip('/')}/api/processFulltextDocument"
+MAX_WORKERS = 16
+
+
+def make_session(pool_size=MAX_WORKERS) -> requests.Session:
+    """HTTP session that keeps one pooled keep-alive connection per worker"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+session = make_session()
+
+
+def process_pdf(session, pdf_path: Path, consolidate_header=True, tei_coordinates=False) -> Path:
+    """Send one PDF to GROBID and write the TEI result to OUTPUT_DIR
+
+    The form fields default to what GrobidClient.process sends: header
+    consolidation on, and no coordinates unless asked for.
+    """
+    data = []
+    if consolidate_header:
+        data.append(('consolidateHeader', '1'))
+    if tei_coordinates:
+        data.extend(('teiCoordinates', c) for c in config.get('coordinates', []))
+    while True:
+        with open(pdf_path, 'rb') as f:
+            response = session.post(
+                GROBID_URL,
+                files={'input': (pdf_path.name, f, 'application/pdf')},
+                data=data,
+                timeout=config.get('timeout', 300)
+            )
+        # GROBID answers 503 when all its workers are busy
+        if response.status_code != 503:
+            break
+        time.sleep(config.get('sleep_time', 5))
+    response.raise_for_status()
+
+    # Mirror the upload's subdirectory so same-named PDFs don't collide
+    xml_path = OUTPUT_DIR / pdf_path.relative_to(UPLOAD_DIR).parent / f"{pdf_path.stem}.tei.xml"
+    xml_path.parent.mkdir(parents=True, exist_ok=True)
+    xml_path.write_bytes(response.content)
+    return xml_path
+
+
+def iter_grobid_outputs(session, n=MAX_WORKERS, **options) -> Iterator[Path]:
+    """Process every uploaded PDF concurrently, yielding TEI paths as they finish
+
+    Like GrobidClient, UPLOAD_DIR is searched recursively and the .pdf
+    extension is matched case-insensitively. `options` go to process_pdf.
+    """
+    pdf_paths = sorted(p for p in UPLOAD_DIR.rglob('*')
+                       if p.is_file() and p.suffix.lower() == '.pdf')
+    with ThreadPoolExecutor(max_workers=n) as executor:
+        futures = {executor.submit(process_pdf, session, p, **options): p for p in pdf_paths}
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except requests.RequestException as e:
+                print(f"GROBID failed on {futures[future].name}: {e}")
+
+
+def grobid_xml_generator(session, n=MAX_WORKERS, **options) -> List[Path]:
+    return list(iter_grobid_outputs(session, n=n, **options))
+
+
+def extract_and_parse(session, workers=4, **options) -> Dict[str, Dict]:
+    """Run GROBID and parse each TEI file as soon as it is written
+
+    GROBID requests run in a background thread that queues each TEI file
+    as its response arrives; a pool of parser threads drains the queue,
+    so parsing overlaps with GROBID's network I/O.
+    `options` go to process_pdf for every GROBID request.
+    Returns the parsed data keyed by TEI path relative to OUTPUT_DIR.
+    """
+    xml_queue = queue.Queue(maxsize=32)
+    errors = []
+
+    def run_grobid():
+        try:
+            for xml_path in iter_grobid_outputs(session, **options):
+                xml_queue.put(xml_path)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            xml_queue.put(None)
+
+    def parse_outputs():
+        parsed = {}
+        while True:
+            xml_path = xml_queue.get()
+            if xml_path is None:
+                # Pass the sentinel on to the other parser threads
+                xml_queue.put(None)
+                return parsed
+            try:
+                parsed[str(xml_path.relative_to(OUTPUT_DIR))] = parse_grobid_xml(str(xml_path))
+            except (etree.XMLSyntaxError, OSError) as e:
+                print(f"Parsing failed on {xml_path.name}: {e}")
 
-def grobid_xml_generator(client):
-    client.process(
-        "processFulltextDocument",
-        str(UPLOAD_DIR),
-        output=str(OUTPUT_DIR),
-        n=1
-    )
+    producer = threading.Thread(target=run_grobid, daemon=True)
+    producer.start()
 
+    results = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        parsers = [executor.submit(parse_outputs) for _ in range(workers)]
+        for parser in parsers:
+            results.update(parser.result())
 
+    producer.join()
+    if errors:
+        raise errors[0]
 
+    return results
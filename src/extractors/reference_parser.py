@@ -3,147 +3,371 @@ Simple Reference Parser - Standalone version
 Works from any directory
 """
 
-import json
+import contextlib
+import itertools
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+import orjson
+import xxhash
+from lxml import etree
+from typing import Callable, Iterator, List, Dict, Optional, Tuple
 
 
-def parse_author(author_elem) -> Optional[Dict]:
-    """Parse an author element"""
-    persName = author_elem.find('persName')
-    if not persName:
-        return None
-    
-    # Get all forenames (first, middle)
-    forenames = persName.find_all('forename')
-    forename_text = ' '.join([f.text for f in forenames]) if forenames else ''
+TEI_NS = 'http://www.tei-c.org/ns/1.0'
+XML_ID = '{http://www.w3.org/XML/1998/namespace}id'
+
+TEI_HEADER_TAG = f'{{{TEI_NS}}}teiHeader'
+BIBL_STRUCT_TAG = f'{{{TEI_NS}}}biblStruct'
+TITLE_TAG = f'{{{TEI_NS}}}title'
+AUTHOR_TAG = f'{{{TEI_NS}}}author'
+DATE_TAG = f'{{{TEI_NS}}}date'
+IDNO_TAG = f'{{{TEI_NS}}}idno'
+BIBL_SCOPE_TAG = f'{{{TEI_NS}}}biblScope'
+MONOGR_TAG = f'{{{TEI_NS}}}monogr'
+
+# Top-level text sections (children of front/body/back) are cleared once
+# they close; nothing is read from them.
+_SECTION_TAGS = tuple(f'{{{TEI_NS}}}{name}' for name in ('div', 'figure', 'note'))
+_SECTION_PARENTS = frozenset(f'{{{TEI_NS}}}{name}' for name in ('front', 'body', 'back'))
+
+
+@dataclass(slots=True)
+class Author:
+    forename: str
+    surname: str
+    full_name: str
+
+
+@dataclass(slots=True)
+class Reference:
+    title: str
+    authors: List[Author] = field(default_factory=list)
+    year: Optional[str] = None
+    doi: Optional[str] = None
+    arxiv: Optional[str] = None
+    venue: Optional[str] = None
+    pages: Optional[str] = None
+    volume: Optional[str] = None
+    grobid_id: str = ''
     
-    # Get surname
-    surname = persName.find('surname')
-    surname_text = surname.text if surname else ''
+    # Placeholders for Semantic Scholar
+    paper_id: Optional[str] = None
+    citation_count: Optional[int] = None
+    full_abstract: Optional[str] = None
+
+
+# libxml2 settings shared by every parse. huge_tree lifts the depth and
+# text-size limits for very large bibliographies; comments and PIs are
+# never read, so they are not built; entities and network lookups are
+# never resolved, so a TEI file can't trigger DTD fetches.
+_PARSER_OPTIONS = {
+    'huge_tree': True,
+    'remove_comments': True,
+    'remove_pis': True,
+    'resolve_entities': False,
+    'no_network': True,
+}
+
+# Bytes read per step when hashing a file for the cache
+_CHUNK_SIZE = 64 * 1024
+
+# Parsed results are cached by XML content hash. Bump the version whenever
+# the output of the parser changes so stale entries are ignored.
+# mkstemp creates owner-only files; outputs get the mode a plain open()
+# would have given them. The umask can only be read by setting it.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_FILE_MODE = 0o666 & ~_UMASK
+
+CACHE_DIR = Path(__file__).resolve().parents[2] / 'data' / 'cache'  # PaperNavigator/data/cache
+_CACHE_VERSION = 2
+
+
+def _build_author(forenames: List[str], surname: str) -> Optional[Author]:
+    """Build an author from the text of its persName"""
+    forename_text = ' '.join(forenames)
+    # Surnames, years and venues repeat across references, so share one copy
+    surname_text = sys.intern(surname)
     
     if not forename_text and not surname_text:
         return None
     
-    return {
-        'forename': forename_text,
-        'surname': surname_text,
-        'full_name': f"{forename_text} {surname_text}".strip()
-    }
+    return Author(
+        forename=forename_text,
+        surname=surname_text,
+        full_name=f"{forename_text} {surname_text}".strip()
+    )
 
 
-def parse_grobid_xml(xml_path: str) -> Dict:
-    """Parse GROBID XML and return main paper + references"""
-    
-    with open(xml_path, 'r', encoding='utf-8') as f:
-        soup = BeautifulSoup(f, 'xml')
-    
-    # ========== MAIN PAPER ==========
+def _build_main_paper(state: Dict) -> Dict:
+    """Build the main paper metadata from the fields collected in the teiHeader"""
     main_paper = {}
     
     # Title
-    title_elem = soup.find('title', {'level': 'a', 'type': 'main'})
-    main_paper['title'] = title_elem.text.strip() if title_elem else "Unknown"
+    main_paper['title'] = state.get('main_title', '').strip() or "Unknown"
     
     # Authors
-    authors = []
-    source_desc = soup.find('sourceDesc')
-    if source_desc:
-        for author_elem in source_desc.find_all('author', recursive=False):
-            author = parse_author(author_elem)
-            if author:
-                authors.append(author)
-    main_paper['authors'] = authors
+    main_paper['authors'] = state['authors']
     
     # Year
-    date_elem = soup.find('date', {'type': 'published'})
-    main_paper['year'] = date_elem.get('when', '').split('-')[0] if date_elem else None
+    when = state.get('when') or ''
+    main_paper['year'] = when[:4] or None
     
     # arXiv
-    arxiv_elem = soup.find('idno', {'type': 'arXiv'})
-    main_paper['arxiv'] = arxiv_elem.text if arxiv_elem else None
+    main_paper['arxiv'] = state.get('arXiv') or None
     
     # DOI
-    doi_elem = soup.find('idno', {'type': 'DOI'})
-    main_paper['doi'] = doi_elem.text if doi_elem else None
+    main_paper['doi'] = state.get('DOI') or None
     
     # Abstract
-    abstract_elem = soup.find('abstract')
-    main_paper['abstract'] = abstract_elem.get_text(strip=True) if abstract_elem else None
+    abstract = state.get('abstract')
+    main_paper['abstract'] = ''.join(abstract) if abstract is not None else None
     
-    # ========== REFERENCES ==========
-    references = []
+    return main_paper
+
+
+def _build_reference(state: Dict, grobid_id: str) -> Reference:
+    """Build a reference from the fields collected in its biblStruct"""
+    # Title
+    title = state.get('a', '').strip() or state.get('m', '').strip()
+    ref = Reference(title=title or "No title", grobid_id=grobid_id)
     
-    for biblStruct in soup.find_all('biblStruct'):
-        # Skip if not a reference
-        grobid_id = biblStruct.get('xml:id', '')
-        if not grobid_id.startswith('b'):
-            continue
-        
-        ref = {}
-        
-        # Title
-        title_elem = biblStruct.find('title', {'level': 'a'})
-        if not title_elem:
-            title_elem = biblStruct.find('title', {'level': 'm'})
-        ref['title'] = title_elem.text.strip() if title_elem else "No title"
-        
-        # Authors
-        ref_authors = []
-        for author_elem in biblStruct.find_all('author'):
-            author = parse_author(author_elem)
+    # Authors
+    ref.authors = state['authors']
+    
+    # Year
+    year = state.get('when', '')[:4]
+    if year:
+        ref.year = sys.intern(year)
+    
+    # DOI
+    ref.doi = state.get('DOI') or None
+    
+    # arXiv
+    ref.arxiv = state.get('arXiv') or None
+    
+    # Venue
+    venue = state.get('venue', '').strip()
+    if venue:
+        ref.venue = sys.intern(venue)
+    
+    # Pages
+    from_page, to_page = state.get('page', ('', ''))
+    if from_page and to_page:
+        ref.pages = f"{from_page}-{to_page}"
+    elif from_page:
+        ref.pages = from_page
+    
+    # Volume
+    ref.volume = state.get('volume', '').strip() or None
+    
+    return ref
+
+
+# XPath queries are compiled once at import and reused for every file.
+# Smart strings are disabled so results don't keep the tree alive.
+def _xpath(path: str) -> etree.XPath:
+    return etree.XPath(path, namespaces={'tei': TEI_NS}, smart_strings=False)
+
+
+_PERS_NAME = _xpath('(.//tei:persName)[1]')
+_FORENAMES = _xpath('.//tei:forename/text()')
+_SURNAME = _xpath('string((.//tei:surname)[1])')
+
+_MAIN_TITLE = _xpath('string((.//tei:title[@level="a"][@type="main"])[1])')
+_SOURCE_DESC = _xpath('(.//tei:sourceDesc)[1]')
+_ABSTRACT = _xpath('(.//tei:abstract)[1]')
+_PUBLISHED_WHEN = _xpath('(.//tei:date[@type="published"])[1]/@when')
+_DOI = _xpath('string((.//tei:idno[@type="DOI"])[1])')
+_ARXIV = _xpath('string((.//tei:idno[@type="arXiv"])[1])')
+
+
+def _parse_author(author_elem) -> Optional[Author]:
+    """Parse an author element"""
+    persName = _PERS_NAME(author_elem)
+    if not persName:
+        return None
+    return _build_author(_FORENAMES(persName[0]), _SURNAME(persName[0]))
+
+
+def _header_fields(header) -> Dict:
+    """Collect the main paper fields from a teiHeader element"""
+    fields = {'main_title': _MAIN_TITLE(header), 'authors': []}
+    
+    source_desc = _SOURCE_DESC(header)
+    if source_desc:
+        for author_elem in source_desc[0].iterchildren(AUTHOR_TAG):
+            author = _parse_author(author_elem)
             if author:
-                ref_authors.append(author)
-        ref['authors'] = ref_authors
-        
-        # Year
-        date_elem = biblStruct.find('date', {'type': 'published'})
-        ref['year'] = None
-        if date_elem:
-            when = date_elem.get('when', '')
-            if when:
-                ref['year'] = when.split('-')[0]
-        
-        # DOI
-        doi_elem = biblStruct.find('idno', {'type': 'DOI'})
-        ref['doi'] = doi_elem.text if doi_elem else None
-        
-        # arXiv
-        arxiv_elem = biblStruct.find('idno', {'type': 'arXiv'})
-        ref['arxiv'] = arxiv_elem.text if arxiv_elem else None
-        
-        # Venue
-        ref['venue'] = None
-        monogr = biblStruct.find('monogr')
-        if monogr:
-            venue_elem = monogr.find('title')
-            if venue_elem:
-                ref['venue'] = venue_elem.text.strip()
-        
-        # Pages
-        ref['pages'] = None
-        page_elem = biblStruct.find('biblScope', {'unit': 'page'})
-        if page_elem:
-            from_page = page_elem.get('from', '')
-            to_page = page_elem.get('to', '')
-            if from_page and to_page:
-                ref['pages'] = f"{from_page}-{to_page}"
-            elif from_page:
-                ref['pages'] = from_page
+                fields['authors'].append(author)
+    
+    when = _PUBLISHED_WHEN(header)
+    if when:
+        fields['when'] = when[0]
+    fields['arXiv'] = _ARXIV(header)
+    fields['DOI'] = _DOI(header)
+    
+    abstract_elem = _ABSTRACT(header)
+    if abstract_elem:
+        fields['abstract'] = [s.strip() for s in abstract_elem[0].itertext()]
+    
+    return fields
+
+
+# Reference fields are collected in a single pass over the biblStruct.
+# Each handler records the first matching element for its field in `state`.
+def _on_title(elem, state: Dict):
+    level = elem.get('level')
+    if level in ('a', 'm') and level not in state:
+        state[level] = ''.join(elem.itertext())
+    # Venue is the first title inside the first monogr
+    monogr = state.get('monogr')
+    if 'venue' not in state and monogr is not None and monogr in elem.iterancestors(MONOGR_TAG):
+        state['venue'] = ''.join(elem.itertext())
+
+
+def _on_author(elem, state: Dict):
+    author = _parse_author(elem)
+    if author:
+        state['authors'].append(author)
+
+
+def _on_date(elem, state: Dict):
+    if elem.get('type') == 'published' and 'when' not in state:
+        state['when'] = elem.get('when', '')
+
+
+def _on_idno(elem, state: Dict):
+    id_type = elem.get('type')
+    if id_type in ('DOI', 'arXiv') and id_type not in state:
+        state[id_type] = ''.join(elem.itertext())
+
+
+def _on_bibl_scope(elem, state: Dict):
+    unit = elem.get('unit')
+    if unit == 'page' and 'page' not in state:
+        state['page'] = (elem.get('from', ''), elem.get('to', ''))
+    elif unit == 'volume' and 'volume' not in state:
+        state['volume'] = ''.join(elem.itertext())
+
+
+def _on_monogr(elem, state: Dict):
+    state.setdefault('monogr', elem)
+
+
+_REFERENCE_HANDLERS = {
+    TITLE_TAG: _on_title,
+    AUTHOR_TAG: _on_author,
+    DATE_TAG: _on_date,
+    IDNO_TAG: _on_idno,
+    BIBL_SCOPE_TAG: _on_bibl_scope,
+    MONOGR_TAG: _on_monogr,
+}
+
+
+def _parse_reference(biblStruct, grobid_id: str) -> Reference:
+    """Parse a single reference biblStruct element"""
+    state = {'authors': []}
+    for elem in biblStruct.iter(*_REFERENCE_HANDLERS):
+        _REFERENCE_HANDLERS[elem.tag](elem, state)
+    return _build_reference(state, grobid_id)
+
+
+def iter_references(xml_path: str, main_paper: Optional[Dict] = None,
+                    on_reference: Optional[Callable[[int, Reference], None]] = None) -> Iterator[Reference]:
+    """Stream references from GROBID XML, one Reference per closed biblStruct
+    
+    If `main_paper` is given it is filled in with the main paper metadata.
+    The header precedes the references, so it is complete by the time the
+    first reference is yielded.
+    `on_reference(i, ref)` is called for each reference as it is parsed.
+    """
+    if main_paper is None:
+        main_paper = {}
+    main_paper.update({
+        'title': "Unknown",
+        'authors': [],
+        'year': None,
+        'arxiv': None,
+        'doi': None,
+        'abstract': None
+    })
+    
+    # libxml2 reads the file itself and only the tags below reach Python
+    i = 0
+    for _, elem in etree.iterparse(str(xml_path), events=('end',),
+                                   tag=(TEI_HEADER_TAG, BIBL_STRUCT_TAG) + _SECTION_TAGS,
+                                   **_PARSER_OPTIONS):
+        tag = elem.tag
+        if tag == TEI_HEADER_TAG:
+            main_paper.update(_build_main_paper(_header_fields(elem)))
+            elem.clear()
+            continue
         
-        # Volume
-        volume_elem = biblStruct.find('biblScope', {'unit': 'volume'})
-        ref['volume'] = volume_elem.text.strip() if volume_elem else None
+        if tag != BIBL_STRUCT_TAG:
+            # Body text is never read: drop each top-level section once it
+            # closes so the tree doesn't grow with the paper's length
+            if elem.getparent().tag in _SECTION_PARENTS:
+                _discard(elem)
+            continue
         
-        # GROBID ID
-        ref['grobid_id'] = grobid_id
+        # Skip if not a reference (e.g. the main paper's own biblStruct,
+        # which is still needed when the header closes)
+        grobid_id = elem.get(XML_ID, '')
+        if not grobid_id.startswith('b'):
+            continue
         
-        # Placeholders for Semantic Scholar
-        ref['paper_id'] = None
-        ref['citation_count'] = None
-        ref['full_abstract'] = None
+        ref = _parse_reference(elem, grobid_id)
+        if on_reference:
+            on_reference(i, ref)
+        i += 1
+        yield ref
         
+        _discard(elem)
+
+
+def _discard(elem):
+    """Drop a processed element and its already-processed predecessors"""
+    elem.clear()
+    while elem.getprevious() is not None:
+        del elem.getparent()[0]
+
+
+def _cache_path(xml_path: str) -> Path:
+    """Cache file for the current contents of xml_path"""
+    digest = xxhash.xxh3_64()
+    with open(xml_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return CACHE_DIR / f"v{_CACHE_VERSION}-{digest.hexdigest()}.json"
+
+
+def _load_author(fields: Dict) -> Author:
+    author = Author(**fields)
+    author.surname = sys.intern(author.surname)
+    return author
+
+
+def _load_cached(cache_path: Path) -> Dict:
+    """Rebuild parsed data from a cache file
+    
+    Surnames, years and venues are interned again, as on a fresh parse.
+    """
+    data = orjson.loads(cache_path.read_bytes())
+    main_paper = data['main_paper']
+    main_paper['authors'] = [_load_author(a) for a in main_paper['authors']]
+    references = []
+    for r in data['references']:
+        r['authors'] = [_load_author(a) for a in r['authors']]
+        ref = Reference(**r)
+        if ref.year:
+            ref.year = sys.intern(ref.year)
+        if ref.venue:
+            ref.venue = sys.intern(ref.venue)
         references.append(ref)
     
     return {
@@ -152,36 +376,171 @@ def parse_grobid_xml(xml_path: str) -> Dict:
     }
 
 
-if __name__ == '__main__':
-    import sys
+def _write_cache(cache_path: Path, data: Dict):
+    """Store parsed data in the cache, if the cache directory is usable
+    
+    The cache only saves time, so a failed write is skipped rather than
+    losing the parse. Entries are written then renamed so concurrent
+    workers never read a partial file.
+    """
+    tmp_path = None
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(orjson.dumps(data))
+        os.chmod(tmp_path, _FILE_MODE)
+        os.replace(tmp_path, cache_path)
+        tmp_path = None
+    except OSError:
+        pass
+    finally:
+        if tmp_path is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+
+
+def parse_grobid_xml(xml_path: str,
+                     on_reference: Optional[Callable[[int, Reference], None]] = None,
+                     use_cache: bool = True) -> Dict:
+    """Parse GROBID XML and return main paper + references
+    
+    Results are cached in CACHE_DIR by file content, so unchanged files
+    are not parsed again.
+    """
+    cache_path = _cache_path(xml_path) if use_cache else None
+    if cache_path is not None and cache_path.exists():
+        data = _load_cached(cache_path)
+        if on_reference:
+            for i, ref in enumerate(data['references']):
+                on_reference(i, ref)
+        return data
+    
+    main_paper = {}
+    references = list(iter_references(xml_path, main_paper, on_reference))
+    data = {
+        'main_paper': main_paper,
+        'references': references
+    }
+    
+    if cache_path is not None:
+        _write_cache(cache_path, data)
+    
+    return data
+
+
+def dump_grobid_xml(xml_path: str, output_path: Path,
+                    on_reference: Optional[Callable[[int, Reference], None]] = None) -> Tuple[Dict, int]:
+    """Parse GROBID XML straight into a JSON file, one reference at a time
+    
+    Writes the same JSON as dumping parse_grobid_xml() with OPT_INDENT_2,
+    but never holds the full reference list or the full output in memory.
+    The output is streamed to a temp file and only replaces output_path
+    once the whole document has parsed.
+    Returns the main paper and the number of references written.
+    """
+    output_path = Path(output_path)
+    main_paper = {}
+    count = 0
+    
+    fd, tmp_path = tempfile.mkstemp(dir=output_path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            references = iter_references(xml_path, main_paper, on_reference)
+            # The header precedes the first reference, so main_paper is complete now
+            first = next(references, None)
+            
+            f.write(b'{\n  "main_paper": ')
+            f.write(orjson.dumps(main_paper, option=orjson.OPT_INDENT_2).replace(b'\n', b'\n  '))
+            if first is None:
+                f.write(b',\n  "references": []\n}')
+            else:
+                f.write(b',\n  "references": [\n')
+                for ref in itertools.chain((first,), references):
+                    if count:
+                        f.write(b',\n')
+                    f.write(b'    ')
+                    f.write(orjson.dumps(ref, option=orjson.OPT_INDENT_2).replace(b'\n', b'\n    '))
+                    count += 1
+                f.write(b'\n  ]\n}')
+        os.chmod(tmp_path, _FILE_MODE)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
     
-    # Check if XML path provided as argument
+    return main_paper, count
+
+
+def parse_many(xml_paths: List[str], workers: Optional[int] = None) -> List[Dict]:
+    """Parse several GROBID XML files in parallel, one process per core"""
+    if len(xml_paths) < 2:
+        return [parse_grobid_xml(xml_path) for xml_path in xml_paths]
+    
+    workers = min(workers or os.cpu_count() or 1, len(xml_paths))
+    # Hand out files in batches to cut IPC overhead, but keep every worker busy
+    chunksize = max(1, min(8, len(xml_paths) // (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(parse_grobid_xml, xml_paths, chunksize=chunksize))
+
+
+if __name__ == '__main__':
+    # Check if XML paths provided as arguments
     if len(sys.argv) > 1:
-        xml_path = sys.argv[1]
+        xml_paths = sys.argv[1:]
     else:
         # Look in current directory
         xml_files = list(Path('.').glob('*.xml'))
-        if xml_files:
-            xml_path = str(xml_files[0])
-        else:
+        if not xml_files:
             # Look in ../../data/outputs
             data_dir = Path(__file__).parent.parent.parent / 'data' / 'outputs'
             xml_files = list(data_dir.glob('*.xml'))
-            if xml_files:
-                xml_path = str(xml_files[0])
-            else:
-                print("Error: No XML files found!")
-                print("Usage: python simple_parser.py [path/to/file.xml]")
-                exit(1)
+        if not xml_files:
+            print("Error: No XML files found!")
+            print("Usage: python simple_parser.py [path/to/file.xml ...]")
+            exit(1)
+        xml_paths = [str(xml_file) for xml_file in sorted(xml_files)]
     
+    if len(xml_paths) > 1:
+        # Batch mode: parse all files in parallel, one JSON next to each XML
+        print(f"Parsing {len(xml_paths)} files")
+        
+        for xml_path, data in zip(xml_paths, parse_many(xml_paths)):
+            output_path = Path(xml_path).with_suffix('.json')
+            output_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            print(f"  {Path(xml_path).name}: {len(data['references'])} references -> {output_path.name}")
+        
+        exit(0)
+    
+    xml_path = xml_paths[0]
     print(f"Parsing: {Path(xml_path).name}")
     
-    # Parse
-    data = parse_grobid_xml(xml_path)
+    print("\n" + "="*80)
+    print("REFERENCES")
+    print("="*80)
+    
+    def preview_reference(i, ref):
+        # Print the first few references while they are being parsed
+        if i >= 5:
+            return
+        print(f"\n[{i + 1}] {ref.title}")
+        if ref.authors:
+            author_names = [a.full_name for a in ref.authors]
+            if len(author_names) > 3:
+                print(f"    Authors: {', '.join(author_names[:3])} + {len(author_names)-3} more")
+            else:
+                print(f"    Authors: {', '.join(author_names)}")
+        print(f"    Year: {ref.year}")
+        if ref.arxiv:
+            print(f"    arXiv: {ref.arxiv}")
+    
+    # Parse and save to JSON as references stream in
+    output_path = Path(xml_path).parent / 'parsed_references.json'
+    main_paper, n_references = dump_grobid_xml(xml_path, output_path, on_reference=preview_reference)
     
     # Print summary
-    main_paper = data['main_paper']
-    references = data['references']
+    if n_references > 5:
+        print(f"\n... and {n_references - 5} more")
     
     print("\n" + "="*80)
     print("MAIN PAPER")
@@ -189,7 +548,7 @@ if __name__ == '__main__':
     print(f"Title: {main_paper['title']}")
     
     if main_paper['authors']:
-        author_names = [a['full_name'] for a in main_paper['authors']]
+        author_names = [a.full_name for a in main_paper['authors']]
         print(f"Authors: {', '.join(author_names[:5])}")
         if len(author_names) > 5:
             print(f"         + {len(author_names) - 5} more")
@@ -197,31 +556,7 @@ if __name__ == '__main__':
     print(f"Year: {main_paper['year']}")
     print(f"arXiv: {main_paper['arxiv']}")
     
-    print("\n" + "="*80)
-    print(f"REFERENCES: {len(references)} found")
-    print("="*80)
-    
-    for i, ref in enumerate(references[:5], 1):
-        print(f"\n[{i}] {ref['title']}")
-        if ref['authors']:
-            author_names = [a['full_name'] for a in ref['authors']]
-            if len(author_names) > 3:
-                print(f"    Authors: {', '.join(author_names[:3])} + {len(author_names)-3} more")
-            else:
-                print(f"    Authors: {', '.join(author_names)}")
-        print(f"    Year: {ref['year']}")
-        if ref['arxiv']:
-            print(f"    arXiv: {ref['arxiv']}")
-    
-    if len(references) > 5:
-        print(f"\n... and {len(references) - 5} more")
-    
-    # Save to JSON
-    output_path = Path(xml_path).parent / 'parsed_references.json'
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    
     print("\n" + "="*80)
     print(f"Saved to {output_path}")
-    print(f"   Main paper + {len(references)} references")
+    print(f"   Main paper + {n_references} references")
     print("="*80)
@@ -0,0 +1,106 @@
+"""
+Regression checks for the GROBID TEI reference parser
+
+The expected JSON was produced by the earlier tree-based parser, so these
+checks pin the streaming parser to the same field semantics: first
+match per field, multi-forename authors, venue from the first title in
+the first monogr, direct-child sourceDesc authors and abstracts with
+inline markup.
+"""
+
+import os
+import stat
+import sys
+from pathlib import Path
+
+import orjson
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src' / 'extractors'))
+
+import reference_parser  # noqa: E402
+
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+SAMPLE_XML = FIXTURES / 'grobid_sample.tei.xml'
+SAMPLE_JSON = FIXTURES / 'grobid_sample.json'
+
+
+def _dumps(data) -> bytes:
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2) + b'\n'
+
+
+def test_parse_grobid_xml_matches_fixture():
+    data = reference_parser.parse_grobid_xml(str(SAMPLE_XML), use_cache=False)
+    assert _dumps(data) == SAMPLE_JSON.read_bytes()
+
+
+def test_iter_references_fills_main_paper_before_first_reference():
+    main_paper = {}
+    references = reference_parser.iter_references(str(SAMPLE_XML), main_paper)
+    first = next(references)
+    assert main_paper['title'] == "Attention Is All You Need"
+    assert first.grobid_id == 'b0'
+    assert [ref.grobid_id for ref in references] == ['b1', 'b2']
+
+
+def test_dump_grobid_xml_matches_fixture(tmp_path):
+    output_path = tmp_path / 'parsed_references.json'
+    main_paper, count = reference_parser.dump_grobid_xml(str(SAMPLE_XML), output_path)
+    assert count == 3
+    assert output_path.read_bytes() + b'\n' == SAMPLE_JSON.read_bytes()
+
+
+def test_dump_grobid_xml_keeps_previous_output_on_parse_error(tmp_path):
+    broken_xml = tmp_path / 'broken.tei.xml'
+    text = SAMPLE_XML.read_text(encoding='utf-8')
+    broken_xml.write_text(text.replace('<biblStruct xml:id="b2">', '<biblStruct xml:id="b2"><bad>'),
+                          encoding='utf-8')
+    output_path = tmp_path / 'parsed_references.json'
+    output_path.write_bytes(b'previous')
+    
+    with pytest.raises(reference_parser.etree.XMLSyntaxError):
+        reference_parser.dump_grobid_xml(str(broken_xml), output_path)
+    
+    assert output_path.read_bytes() == b'previous'
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['broken.tei.xml', 'parsed_references.json']
+
+
+def test_parse_grobid_xml_cache_hit_rebuilds_records(monkeypatch, tmp_path):
+    monkeypatch.setattr(reference_parser, 'CACHE_DIR', tmp_path / 'cache')
+    parsed = reference_parser.parse_grobid_xml(str(SAMPLE_XML))
+    assert len(list((tmp_path / 'cache').iterdir())) == 1
+    
+    def no_parse(*args):
+        raise AssertionError("cache hit should not parse the XML")
+    monkeypatch.setattr(reference_parser, 'iter_references', no_parse)
+    seen = []
+    cached = reference_parser.parse_grobid_xml(str(SAMPLE_XML), on_reference=lambda i, ref: seen.append((i, ref)))
+    assert cached == parsed
+    assert all(isinstance(ref, reference_parser.Reference) for ref in cached['references'])
+    assert all(isinstance(author, reference_parser.Author)
+               for ref in cached['references'] for author in ref.authors)
+    assert all(isinstance(author, reference_parser.Author) for author in cached['main_paper']['authors'])
+    assert seen == list(enumerate(cached['references']))
+
+
+def test_parse_grobid_xml_skips_unusable_cache(monkeypatch, tmp_path):
+    # A file where the cache directory should be makes every write fail
+    blocker = tmp_path / 'cache'
+    blocker.write_bytes(b'')
+    monkeypatch.setattr(reference_parser, 'CACHE_DIR', blocker)
+    data = reference_parser.parse_grobid_xml(str(SAMPLE_XML))
+    assert _dumps(data) == SAMPLE_JSON.read_bytes()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['cache']
+
+
+def test_outputs_get_default_file_mode(monkeypatch, tmp_path):
+    umask = os.umask(0)
+    os.umask(umask)
+    monkeypatch.setattr(reference_parser, 'CACHE_DIR', tmp_path / 'cache')
+    output_path = tmp_path / 'parsed_references.json'
+    reference_parser.dump_grobid_xml(str(SAMPLE_XML), output_path)
+    reference_parser.parse_grobid_xml(str(SAMPLE_XML))
+    
+    for path in [output_path, *(tmp_path / 'cache').iterdir()]:
+        assert stat.S_IMODE(path.stat().st_mode) == 0o666 & ~umask